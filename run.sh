@@ -1,4 +1,7 @@
 #!/bin/bash
+# For headless runs (cron, workers) set SERVICE_ACCOUNT_FILE_NAME, or run once
+# interactively with PERSIST_TOKEN=true and then set SHEETS_NON_INTERACTIVE=true.
+# TOKEN_FILE_NAME overrides the OAuth token path (default: token.json).
 
 echo "🐍 Activating virtual environment..."
 source venv/bin/activate
@@ -29,3 +29,9 @@ pip install python-dotenv requests pandas gspread oauth2client google-api-python
 echo "✅ Setup complete!"
 echo "To activate the virtual environment later, run:"
 echo "source venv/bin/activate"
+echo ""
+echo "Optional .env settings for headless runs (cron, workers):"
+echo "  SERVICE_ACCOUNT_FILE_NAME=<key.json>  authenticate with a service account instead of OAuth"
+echo "  TOKEN_FILE_NAME=<path>                OAuth token file (default: token.json)"
+echo "  PERSIST_TOKEN=true                    keep the OAuth token file between runs"
+echo "  SHEETS_NON_INTERACTIVE=true           never open a browser; fail if no valid token (implies PERSIST_TOKEN)"
@@ -1,7 +1,6 @@
 import os
 
 import requests
-import pandas as pd
 import time
 from dotenv import load_dotenv
 
@@ -38,6 +37,8 @@ class CompanyFinancials:
         ts = data.get("Time Series (Daily)")
         if not ts:
             raise Exception(f"No daily time series data returned for {self.ticker}")
+        # Deferred so that startup does not pay for importing pandas.
+        import pandas as pd
         df = pd.DataFrame.from_dict(ts, orient='index')
         df = df.rename(columns={
             "1. open": "Open",
@@ -1,17 +1,24 @@
 import os
+import tempfile
 
-import httplib2
 from dotenv import load_dotenv
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 # Load variables from .env into the environment
 load_dotenv()
 
+
+def _env_flag(name):
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes')
+
+
 CREDENTIALS_FILE = os.getenv('OAUTH_CRED_FILE_NAME')
+SERVICE_ACCOUNT_FILE = os.getenv('SERVICE_ACCOUNT_FILE_NAME')
+TOKEN_FILE = os.getenv('TOKEN_FILE_NAME', 'token.json')
+# When set, never open a browser for OAuth (cron jobs, sharded workers).
+NON_INTERACTIVE = _env_flag('SHEETS_NON_INTERACTIVE')
+# When set, the token file is kept between runs instead of being deleted at the end.
+# Non-interactive runs always keep it, since the next run could not recreate it.
+PERSIST_TOKEN = _env_flag('PERSIST_TOKEN') or NON_INTERACTIVE
 SPREADSHEET_ID = os.getenv('GOOGLE_SPREAD_SHEET_ID')
 WORKSHEET_NAME = os.getenv('WORK_SHEET_NAME')
 
@@ -24,25 +31,62 @@ class GoogleSheetsUploader:
             "https://www.googleapis.com/auth/drive"
         ]
 
+        self.persist_token = PERSIST_TOKEN
+        # Only the OAuth path reads and writes the token file.
+        self.uses_token_file = not SERVICE_ACCOUNT_FILE
+
+        creds = self._get_credentials(scopes)
+
+        from googleapiclient.discovery import build
+        service = build("sheets", "v4", credentials=creds,
+                        static_discovery=True, cache_discovery=False)
+        self.sheet = service.spreadsheets()
+
+    def _get_credentials(self, scopes):
+        if SERVICE_ACCOUNT_FILE:
+            from google.oauth2 import service_account
+            return service_account.Credentials.from_service_account_file(
+                SERVICE_ACCOUNT_FILE, scopes=scopes
+            )
+
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+
         creds = None
-        if os.path.exists("token.json"):
-            creds = Credentials.from_authorized_user_file("token.json", scopes)
+        if os.path.exists(TOKEN_FILE):
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, scopes)
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(Request())
+            elif NON_INTERACTIVE:
+                raise Exception(
+                    f"No valid credentials found in {TOKEN_FILE} and interactive "
+                    "auth is disabled. Set SERVICE_ACCOUNT_FILE_NAME or provide a token file."
+                )
             else:
+                from google_auth_oauthlib.flow import InstalledAppFlow
                 flow = InstalledAppFlow.from_client_secrets_file(
                     CREDENTIALS_FILE, scopes
                 )
                 creds = flow.run_local_server(port=0)
             # Save the credentials for the next run
-            with open("token.json", "w") as token:
-                token.write(creds.to_json())
+            self._save_token(creds)
+        return creds
+
+    def _save_token(self, creds):
+        # Write to a temp file and swap it in, so that other workers sharing
+        # the token file never read it half-written.
+        token_dir = os.path.dirname(os.path.abspath(TOKEN_FILE))
+        tmp_path = None
         try:
-            service = build("sheets", "v4", credentials=creds)
-            self.sheet = service.spreadsheets()
-        except HttpError as err:
-            raise err
+            with tempfile.NamedTemporaryFile("w", dir=token_dir, delete=False) as token:
+                tmp_path = token.name
+                token.write(creds.to_json())
+            os.replace(tmp_path, TOKEN_FILE)
+        except OSError as e:
+            print(f"Warning: could not save token to {TOKEN_FILE}, continuing with in-memory credentials:", e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def append_row(self, row_values: list):
         body = {
@@ -62,7 +106,11 @@ class GoogleSheetsUploader:
             print("Error uploading row:", e)
 
     def destroy_token_file(self):
-        token_file = "token.json"
+        # Service-account runs never use the token file, and persisted tokens
+        # are kept for the next run.
+        if not self.uses_token_file or self.persist_token:
+            return
+        token_file = TOKEN_FILE
         if os.path.exists(token_file):
             try:
                 os.remove(token_file)
@@ -100,5 +148,6 @@ if __name__ == '__main__':
     try:
         uploader = GoogleSheetsUploader()
         uploader.append_row(row_data)
+        uploader.destroy_token_file()
     except Exception as e:
         print("Error uploading row:", e)
@@ -1,8 +1,8 @@
+import csv
+import io
 import os
 
 import requests
-import pandas as pd
-import io
 from dotenv import load_dotenv
 
 from TickerData import TickerData
@@ -29,8 +29,7 @@ class Tickers:
             raise Exception(f"API request unsuccessful: HTTP {response.status_code}")
 
         # Parse the CSV data from the response text.
-        tickers_df = pd.read_csv(io.StringIO(response.text))
-        return tickers_df
+        return list(csv.DictReader(io.StringIO(response.text)))
 
     def _get_ticker_data(self):
         """
@@ -39,11 +38,11 @@ class Tickers:
             Returns:
                 A dictionary with ticker symbols as keys and TickerData instances as values.
             """
-        tickers_df = self._get_all_tickers()
+        tickers_rows = self._get_all_tickers()
         ticker_map = {}
 
-        # Iterate through each row in the DataFrame and create a TickerData object.
-        for _, row in tickers_df.iterrows():
+        # Iterate through each row of the CSV and create a TickerData object.
+        for row in tickers_rows:
             # The CSV from Alpha Vantage is expected to have the following columns:
             # "symbol", "name", "exchange", "assetType", "ipoDate", "delistingDate", "status"
             symbol = row['symbol']
@@ -51,7 +50,8 @@ class Tickers:
             exchange = row['exchange']
             asset_type = row['assetType']
             ipo_date = row['ipoDate']
-            delisting_date = row['delistingDate']
+            # Active listings report a literal 'null' delisting date.
+            delisting_date = row['delistingDate'] if row['delistingDate'] not in ('null', '') else None
             status = row['status']
 
             ticker_data = TickerData(symbol, name, exchange, asset_type, ipo_date, delisting_date, status)
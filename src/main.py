@@ -1,15 +1,33 @@
 import time
 
+start_time = time.perf_counter()
+
 from dotenv import load_dotenv
 
 from CompanyFinancials import CompanyFinancials
 from GoogleSheetsUploader import GoogleSheetsUploader
 from Tickers import Tickers
 
+import_time = time.perf_counter() - start_time
+
 load_dotenv()
 
-tickers = Tickers()
+step_start = time.perf_counter()
 sheets_uploader = GoogleSheetsUploader()
+auth_time = time.perf_counter() - step_start
+startup_time = time.perf_counter() - start_time
+
+# The ticker listing is a network download whose cost depends on the API,
+# so it is reported apart from startup.
+step_start = time.perf_counter()
+tickers = Tickers()
+tickers_time = time.perf_counter() - step_start
+
+print("Startup report:")
+print(f"  Module imports: {import_time:.3f}s")
+print(f"  Sheets auth and client setup (incl. google imports): {auth_time:.3f}s")
+print(f"  Total startup: {startup_time:.3f}s")
+print(f"Ticker listing fetch: {tickers_time:.3f}s")
 
 for ticker in tickers.data.keys():
     print(f"Start processing ticker {ticker}")
@@ -50,4 +68,4 @@ for ticker in tickers.data.keys():
 
     time.sleep(5)
 
-sheets_uploader.destroy_token_file()
\ No newline at end of file
+sheets_uploader.destroy_token_file()